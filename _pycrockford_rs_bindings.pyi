@@ -1,6 +1,7 @@
 """Type stubs for the Rust extension module."""
 
 import uuid
+from collections.abc import Iterable
 
 class CrockfordUUID:
     """UUID held as 16 raw bytes, rendered as Crockford Base32."""
@@ -18,3 +19,6 @@ class CrockfordUUID:
 
 def encode_crockford(b: bytes) -> str: ...
 def decode_crockford(s: str) -> bytes: ...
+def try_decode_crockford_int(s: str) -> int | None: ...
+def encode_crockford_many(buf: bytes) -> list[str]: ...
+def decode_crockford_many(items: Iterable[str]) -> bytes: ...
@@ -3,17 +3,27 @@
 
 from __future__ import annotations
 
-from _pycrockford_rs_bindings import decode_crockford, encode_crockford
+from _pycrockford_rs_bindings import (
+    decode_crockford,
+    decode_crockford_many,
+    encode_crockford,
+    encode_crockford_many,
+)
 
 from .exceptions import CrockfordUUIDError
-from .hooks import cuuid_decoder, cuuid_encoder
-from .types import CrockfordUUID
+from .hooks import cuuid_decoder, cuuid_encoder, make_decoder
+from .types import CrockfordUUID, CrockfordUUIDField, decode_many
 
 __all__ = [
     "CrockfordUUID",
     "CrockfordUUIDError",
+    "CrockfordUUIDField",
     "cuuid_decoder",
     "cuuid_encoder",
     "decode_crockford",
+    "decode_crockford_many",
+    "decode_many",
     "encode_crockford",
+    "encode_crockford_many",
+    "make_decoder",
 ]
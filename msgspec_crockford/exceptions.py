@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+# Shared with the msgspec decode hook, which reports the same condition as a
+# `msgspec.ValidationError` without constructing this exception first.
+_INVALID_STRING_MESSAGE = "invalid Crockford UUID string"
+
 
 class CrockfordUUIDError(ValueError):
     """Error raised for invalid Crockford UUID operations."""
@@ -11,6 +15,11 @@ class CrockfordUUIDError(ValueError):
         """Build an error for a byte payload of the wrong length."""
         return cls(f"expected {expected} bytes, got {actual}")
 
+    @classmethod
+    def invalid_string(cls) -> CrockfordUUIDError:
+        """Build an error for a string that is not a Crockford UUID."""
+        return cls(_INVALID_STRING_MESSAGE)
+
     @classmethod
     def unsupported_value(cls) -> CrockfordUUIDError:
         """Build an error for a value of an unsupported type."""
@@ -3,14 +3,24 @@
 
 from __future__ import annotations
 
+import contextlib
+import functools
 import typing as typ
 from types import NotImplementedType, UnionType
 
 import msgspec
+import msgspec.json as msjson
 
-from .exceptions import CrockfordUUIDError
+from _pycrockford_rs_bindings import try_decode_crockford_int
+
+from .exceptions import _INVALID_STRING_MESSAGE
 from .types import CrockfordUUID
 
+if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+
+    _FromInt: typ.TypeAlias = cabc.Callable[[int], CrockfordUUID]
+
 
 def _invalid_payload_error(obj: object) -> msgspec.ValidationError:
     """Build a validation error for a non-string CrockfordUUID payload."""
@@ -19,26 +29,83 @@ def _invalid_payload_error(obj: object) -> msgspec.ValidationError:
     )
 
 
-def cuuid_decoder(type_hint: object, obj: object) -> CrockfordUUID | NotImplementedType:
+def _invalid_string_error() -> msgspec.ValidationError:
+    """Build a validation error for a malformed Crockford string."""
+    return msgspec.ValidationError(_INVALID_STRING_MESSAGE)
+
+
+# msgspec invokes `dec_hook` for every custom-typed value it decodes, but only
+# ever with a handful of distinct type hints; remember, for each, the
+# constructor to use or `None` when the hint is not for `CrockfordUUID`.
+_crockford_hint_cache: dict[object, _FromInt | None] = {
+    CrockfordUUID: CrockfordUUID._from_int,
+}
+
+
+def _is_crockford_union(type_hint: object) -> bool:
+    """Return whether ``type_hint`` is a union that includes `CrockfordUUID`."""
+    if typ.get_origin(type_hint) not in {typ.Union, UnionType}:
+        return False
+    return CrockfordUUID in typ.get_args(type_hint)
+
+
+def _resolve_hint(type_hint: object) -> _FromInt | None:
+    """Look up and cache the constructor for a hint not seen before."""
+    from_int = CrockfordUUID._from_int if _is_crockford_union(type_hint) else None
+    # Hints carrying unhashable metadata, such as `Annotated[list, {...}]`,
+    # cannot be cached and are resolved afresh on every call.
+    with contextlib.suppress(TypeError):
+        _crockford_hint_cache[type_hint] = from_int
+    return from_int
+
+
+def cuuid_decoder(
+    type_hint: object,
+    obj: object,
+    _decode: cabc.Callable[[str], int | None] = try_decode_crockford_int,
+    _hint_cache: dict[object, _FromInt | None] = _crockford_hint_cache,
+) -> CrockfordUUID | NotImplementedType:
     """Decode CrockfordUUID strings for msgspec."""
-    origin = typ.get_origin(type_hint)
-    args = typ.get_args(type_hint)
-    is_crockford_type = type_hint is CrockfordUUID or (
-        origin in {typ.Union, UnionType} and CrockfordUUID in args
-    )
+    # The underscored defaults bind the module-level names read on every call
+    # at definition time, turning global lookups into local reads; a cache hit
+    # also yields the constructor. Names used only on a cache miss or an error
+    # stay global.
+    try:
+        from_int = _hint_cache[type_hint]
+    except (KeyError, TypeError):
+        from_int = _resolve_hint(type_hint)
+    if from_int is None:
+        return NotImplemented
 
-    if is_crockford_type:
-        if obj is None:
-            return NotImplemented
-        if isinstance(obj, str):
-            try:
-                return CrockfordUUID(obj)
-            except CrockfordUUIDError as exc:
-                raise msgspec.ValidationError(str(exc)) from exc
-        raise _invalid_payload_error(obj)
-    return NotImplemented
+    if isinstance(obj, str):
+        # Decode straight to the integer `uuid.UUID` stores, bypassing the
+        # constructor's type dispatch and any intermediate `bytes`.
+        int_value = _decode(obj)
+        if int_value is None:
+            raise _invalid_string_error()
+        return from_int(int_value)
+    if obj is None:
+        return NotImplemented
+    raise _invalid_payload_error(obj)
 
 
-def cuuid_encoder(obj: object) -> str | NotImplementedType:
+def cuuid_encoder(
+    obj: object, _cls: type[CrockfordUUID] = CrockfordUUID
+) -> str | NotImplementedType:
     """Encode CrockfordUUID instances for msgspec."""
-    return str(obj) if isinstance(obj, CrockfordUUID) else NotImplemented
+    # `_cls` is bound at definition time so the lookup is a local read; the
+    # identity test covers the usual case without walking the MRO.
+    if type(obj) is _cls or isinstance(obj, _cls):
+        return str(obj)
+    return NotImplemented
+
+
+@functools.cache
+def make_decoder(type_hint: object) -> msjson.Decoder[typ.Any]:
+    """Return a shared JSON decoder for ``type_hint`` wired to `cuuid_decoder`.
+
+    Building a `msgspec.json.Decoder` compiles a parser for its type, so
+    decoders should be created once and reused. Repeated calls with the same
+    hint return the same instance.
+    """
+    return msjson.Decoder(type=type_hint, dec_hook=cuuid_decoder)
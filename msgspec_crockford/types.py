@@ -6,39 +6,98 @@ from __future__ import annotations
 import typing as typ
 import uuid as py_uuid
 
-from _pycrockford_rs_bindings import decode_crockford, encode_crockford
+import msgspec
+
+from _pycrockford_rs_bindings import (
+    decode_crockford_many,
+    encode_crockford,
+    try_decode_crockford_int,
+)
 
 from .exceptions import CrockfordUUIDError
 
+if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+
+
+# Canonical 26-symbol form: any case, the I/L/O aliases, no hyphens, and a final
+# symbol whose two padding bits are zero.
+_CROCKFORD_UUID_PATTERN = (
+    r"^[0-9A-HJKMNP-TV-Za-hjkmnp-tv-zIiLlOo]{25}[048CGMRWcgmrwOo]$"
+)
+
+CrockfordUUIDField: typ.TypeAlias = typ.Annotated[
+    str,
+    msgspec.Meta(
+        pattern=_CROCKFORD_UUID_PATTERN,
+        # msgspec matches with `re.search`, where `$` also accepts a trailing
+        # newline; pinning the length rejects it and stays valid JSON Schema.
+        min_length=26,
+        max_length=26,
+        description="A UUID in canonical Crockford Base32 form",
+    ),
+]
+"""A validated Crockford UUID string that msgspec checks without a `dec_hook`.
+
+msgspec validates the pattern itself, so fields using this annotation never
+reach `cuuid_decoder`. Values stay `str`; convert them with `CrockfordUUID` or,
+for many values at once, `decode_many`.
+"""
+
 
 class CrockfordUUID(py_uuid.UUID):
     """UUID stored as Crockford Base32 when stringified."""
 
+    # `uuid.UUID` declares `__slots__`; keeping ours slotted avoids a per-instance
+    # `__dict__` and gives the lazily derived views somewhere to live.
+    __slots__ = ("_cstr", "_plain_uuid")
+    _cstr: str | None
+    _plain_uuid: py_uuid.UUID | None
+
     _expected_length: typ.ClassVar[int] = 16
 
-    def __new__(cls, value: str | bytes | py_uuid.UUID) -> CrockfordUUID:
+    def __new__(cls, value: str | bytes | bytearray | py_uuid.UUID) -> CrockfordUUID:
         """Create an instance from a Crockford string, bytes, or UUID."""
-        if isinstance(value, py_uuid.UUID):
-            bytes_value = value.bytes
+        # msgspec always passes exact `str` instances, so settle that case with
+        # an identity test before walking any MROs; subclasses still match via
+        # `isinstance`.
+        if type(value) is str or isinstance(value, str):
+            # A `None` verdict spares the Rust side from building an exception
+            # that would only be replaced by ours.
+            int_value = try_decode_crockford_int(value)
+            if int_value is None:
+                raise CrockfordUUIDError.invalid_string()
         elif isinstance(value, (bytes, bytearray)):
             if len(value) != cls._expected_length:
                 raise CrockfordUUIDError.invalid_length(
                     cls._expected_length, len(value)
                 )
-            bytes_value = bytes(value)
-        elif isinstance(value, str):
-            try:
-                bytes_value = decode_crockford(value)
-            except ValueError as exc:
-                raise CrockfordUUIDError(str(exc)) from exc
+            # The buffer is read once, here, and never retained, so a later
+            # mutation of a `bytearray` cannot leak in and no copy is needed.
+            int_value = int.from_bytes(value, "big")
+        elif isinstance(value, py_uuid.UUID):
+            int_value = value.int
         else:
             raise CrockfordUUIDError.unsupported_value()
-        obj = object.__new__(cls)
-        py_uuid.UUID.__init__(obj, bytes=bytes_value)
-        return obj
+        return cls._from_int(int_value)
 
-    def __init__(self, value: str | bytes | py_uuid.UUID) -> None:
+    def __init__(self, value: str | bytes | bytearray | py_uuid.UUID) -> None:
         """Accept the constructor value; state is populated in `__new__`."""
+        # Kept as a Python method rather than `object.__init__`: the latter only
+        # ignores the argument while `tp_init` is `object_init`, so subclasses
+        # chaining `super().__init__(value)` would raise `TypeError`.
+
+    @classmethod
+    def _from_int(cls, int_value: int) -> CrockfordUUID:
+        """Build an instance from an already validated 128-bit integer."""
+        obj = object.__new__(cls)
+        # Populate the slots `uuid.UUID.__init__` would set directly; its keyword
+        # parsing and validation are redundant once the value is known good.
+        object.__setattr__(obj, "int", int_value)
+        object.__setattr__(obj, "is_safe", py_uuid.SafeUUID.unknown)
+        object.__setattr__(obj, "_cstr", None)
+        object.__setattr__(obj, "_plain_uuid", None)
+        return obj
 
     @classmethod
     def generate_v4(cls) -> CrockfordUUID:
@@ -55,12 +114,44 @@ class CrockfordUUID(py_uuid.UUID):
     @property
     def uuid(self) -> py_uuid.UUID:
         """A plain `uuid.UUID` view of this identifier."""
-        return py_uuid.UUID(bytes=self.bytes)
+        # Kept distinct from `self` so `str()` on it gives the canonical hex form;
+        # built once, since instances are immutable.
+        plain = self._plain_uuid
+        if plain is None:
+            plain = py_uuid.UUID(int=self.int)
+            object.__setattr__(self, "_plain_uuid", plain)
+        return plain
 
     def __str__(self) -> str:
         """Render the identifier as Crockford Base32."""
-        return encode_crockford(self.bytes)
+        # Instances are immutable, so the encoding is computed at most once.
+        encoded = self._cstr
+        if encoded is None:
+            encoded = encode_crockford(self.bytes)
+            object.__setattr__(self, "_cstr", encoded)
+        return encoded
 
     def __repr__(self) -> str:
         """Render a constructor-style representation."""
-        return f"CrockfordUUID('{self}')"
+        # Concatenating the cached `str()` skips the `format()` protocol an
+        # f-string replacement field goes through.
+        return "CrockfordUUID('" + str(self) + "')"
+
+
+def decode_many(values: cabc.Iterable[str]) -> list[CrockfordUUID]:
+    """Decode many Crockford strings with a single call into the Rust codec.
+
+    This suits bulk pipelines, such as post-processing a decoded
+    ``list[str]`` field, where per-item construction would cross into Rust
+    once per identifier. The GIL is released while the batch decodes, so
+    threads working on separate batches run in parallel.
+    """
+    try:
+        packed = decode_crockford_many(values)
+    except ValueError as exc:
+        raise CrockfordUUIDError(str(exc)) from exc
+    from_int = CrockfordUUID._from_int
+    return [
+        from_int(int.from_bytes(packed[offset : offset + 16], "big"))
+        for offset in range(0, len(packed), 16)
+    ]
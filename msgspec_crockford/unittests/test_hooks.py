@@ -3,6 +3,8 @@
 
 from __future__ import annotations
 
+import typing as typ
+
 import msgspec
 import pytest
 
@@ -29,6 +31,18 @@ def test_invalid_obj_type_raises() -> None:
         cuuid_decoder(CrockfordUUID, 123)
 
 
+def test_encoder_accepts_subclasses() -> None:
+    """Subclasses of `CrockfordUUID` still encode to their Crockford form."""
+
+    class TaggedUUID(CrockfordUUID):
+        """A user-defined `CrockfordUUID` subclass."""
+
+        __slots__ = ()
+
+    tagged = TaggedUUID(CrockfordUUID.generate_v4())
+    assert cuuid_encoder(tagged) == str(tagged)
+
+
 def test_hooks_return_not_implemented() -> None:
     """The hooks defer to msgspec for unrelated types."""
     assert cuuid_decoder(str, "abc") is NotImplemented
@@ -41,3 +55,20 @@ def test_decoder_optional_handling() -> None:
     uuid_obj = CrockfordUUID.generate_v4()
     assert cuuid_decoder(hint, None) is NotImplemented
     assert cuuid_decoder(hint, str(uuid_obj)) == uuid_obj
+
+
+def test_decoder_caches_union_hints() -> None:
+    """Repeated union hints decode consistently once their verdict is cached."""
+    hint = CrockfordUUID | int
+    uuid_obj = CrockfordUUID.generate_v4()
+    assert cuuid_decoder(hint, str(uuid_obj)) == uuid_obj
+    assert cuuid_decoder(hint, str(uuid_obj)) == uuid_obj
+    assert cuuid_decoder(int | str, "abc") is NotImplemented
+    assert cuuid_decoder(int | str, "abc") is NotImplemented
+
+
+def test_decoder_handles_unhashable_hints() -> None:
+    """Hints that cannot be cached are still resolved rather than raising."""
+    hint = typ.Annotated[list, {"x": 1}]
+    assert cuuid_decoder(hint, "abc") is NotImplemented
+    assert cuuid_decoder(hint, "abc") is NotImplemented
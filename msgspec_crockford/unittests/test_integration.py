@@ -6,7 +6,12 @@ from __future__ import annotations
 import msgspec
 import pytest
 
-from msgspec_crockford import CrockfordUUID, cuuid_decoder
+from msgspec_crockford import (
+    CrockfordUUID,
+    CrockfordUUIDField,
+    decode_many,
+    make_decoder,
+)
 
 
 class Record(msgspec.Struct):
@@ -16,17 +21,59 @@ class Record(msgspec.Struct):
     name: str
 
 
+class FieldRecord(msgspec.Struct):
+    """Sample struct validating Crockford UUIDs without a decode hook."""
+
+    ids: list[CrockfordUUIDField]
+
+
+def _unexpected_hook(type_hint: object, obj: object) -> object:
+    """Fail if msgspec falls back to a decode hook."""
+    pytest.fail(f"dec_hook called for {type_hint!r} with {obj!r}")
+
+
+# Decoders compile a parser for their type on construction; build them once.
+RECORD_DECODER = make_decoder(Record)
+FIELD_RECORD_DECODER = msgspec.json.Decoder(type=FieldRecord, dec_hook=_unexpected_hook)
+
+
 def test_msgspec_roundtrip() -> None:
     """A struct with a Crockford UUID field survives a JSON round trip."""
     record = Record(CrockfordUUID.generate_v4(), "example")
     encoder = msgspec.json.Encoder()
     data = encoder.encode({"id": str(record.id), "name": record.name})
-    decoder = msgspec.json.Decoder(type=Record, dec_hook=cuuid_decoder)
-    assert decoder.decode(data) == record
+    assert RECORD_DECODER.decode(data) == record
 
 
 def test_msgspec_invalid() -> None:
     """A malformed identifier fails msgspec validation."""
-    dec = msgspec.json.Decoder(type=Record, dec_hook=cuuid_decoder)
     with pytest.raises(msgspec.ValidationError):
-        dec.decode(b'{"id":"invalid","name":"x"}')
+        RECORD_DECODER.decode(b'{"id":"invalid","name":"x"}')
+
+
+def test_make_decoder_is_shared() -> None:
+    """`make_decoder` hands back one decoder per type hint."""
+    assert make_decoder(Record) is RECORD_DECODER
+    assert make_decoder(FieldRecord) is not RECORD_DECODER
+
+
+def test_field_decodes_without_hook() -> None:
+    """`CrockfordUUIDField` values validate without invoking the hook."""
+    originals = [CrockfordUUID.generate_v4() for _ in range(3)]
+    data = msgspec.json.encode({"ids": [str(cuuid).lower() for cuuid in originals]})
+    assert decode_many(FIELD_RECORD_DECODER.decode(data).ids) == originals
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "invalid",
+        "000G40R40M30E209185GR38E1X",
+        "000G40R4-0M30E209-185GR38E1W",
+        "000G40R40M30E209185GR38E1W\n",
+    ],
+)
+def test_field_rejects_non_canonical(value: str) -> None:
+    """Malformed or non-canonical strings fail msgspec validation."""
+    with pytest.raises(msgspec.ValidationError):
+        FIELD_RECORD_DECODER.decode(msgspec.json.encode({"ids": [value]}))
@@ -7,7 +7,7 @@ import uuid
 
 import pytest
 
-from msgspec_crockford import CrockfordUUID, CrockfordUUIDError
+from msgspec_crockford import CrockfordUUID, CrockfordUUIDError, decode_many
 
 
 def test_str_round_trip() -> None:
@@ -16,6 +16,62 @@ def test_str_round_trip() -> None:
     assert CrockfordUUID(str(cuuid)) == cuuid
 
 
+def test_str_subclass_input() -> None:
+    """String subclasses decode like plain strings."""
+
+    class Token(str):  # noqa: FURB189 - the subclass itself is under test.
+        """A `str` subclass standing in for user-defined string types."""
+
+    cuuid = CrockfordUUID.generate_v4()
+    assert CrockfordUUID(Token(str(cuuid))) == cuuid
+
+
+def test_uuid_state_matches_source() -> None:
+    """Construction populates the same state as `uuid.UUID` itself."""
+    source = uuid.uuid4()
+    cuuid = CrockfordUUID(source)
+    assert cuuid.int == source.int
+    assert cuuid.bytes == source.bytes
+    assert cuuid.is_safe is uuid.SafeUUID.unknown
+    assert cuuid.hex == source.hex
+
+
+def test_equality_and_hashing() -> None:
+    """Equality and hashing agree with `uuid.UUID` across both types."""
+    source = uuid.uuid4()
+    cuuid = CrockfordUUID(source)
+    assert cuuid == CrockfordUUID(str(cuuid))
+    assert cuuid == source
+    assert source == cuuid
+    assert cuuid != CrockfordUUID.generate_v4()
+    assert hash(cuuid) == hash(source)
+    assert len({cuuid, CrockfordUUID(source.bytes), source}) == 1
+
+
+def test_subclass_can_chain_init() -> None:
+    """Subclasses may pass the constructor value on to `super().__init__`."""
+    seen: list[str] = []
+
+    class Tagged(CrockfordUUID):
+        __slots__ = ()
+
+        def __init__(self, value: str) -> None:
+            super().__init__(value)
+            seen.append(value)
+
+    cuuid = CrockfordUUID.generate_v4()
+    assert Tagged(str(cuuid)) == cuuid
+    assert seen == [str(cuuid)]
+
+
+def test_str_is_memoized() -> None:
+    """Repeated stringification reuses the first encoded value."""
+    cuuid = CrockfordUUID.generate_v4()
+    first = str(cuuid)
+    assert str(cuuid) is first
+    assert repr(cuuid) == f"CrockfordUUID('{first}')"
+
+
 def test_uuid_property_returns_uuid() -> None:
     """The `uuid` property exposes an equivalent plain `uuid.UUID`."""
     cuuid = CrockfordUUID.generate_v4()
@@ -23,6 +79,23 @@ def test_uuid_property_returns_uuid() -> None:
     assert cuuid.uuid.bytes == cuuid.bytes
 
 
+def test_uuid_property_is_cached_plain_uuid() -> None:
+    """The `uuid` view is a plain `uuid.UUID`, built once per instance."""
+    cuuid = CrockfordUUID.generate_v4()
+    plain = cuuid.uuid
+    assert type(plain) is uuid.UUID
+    assert str(plain) == str(uuid.UUID(bytes=cuuid.bytes))
+    assert cuuid.uuid is plain
+
+
+def test_bytearray_input_is_not_aliased() -> None:
+    """Mutating a `bytearray` after construction leaves the identifier intact."""
+    raw = bytearray(range(16))
+    cuuid = CrockfordUUID(raw)
+    raw[0] = 0xFF
+    assert cuuid.bytes == bytes(range(16))
+
+
 def test_invalid_bytes_length() -> None:
     """A byte payload that is not 16 bytes long is rejected."""
     with pytest.raises(CrockfordUUIDError, match="expected 16 bytes"):
@@ -31,7 +104,7 @@ def test_invalid_bytes_length() -> None:
 
 def test_invalid_string_input() -> None:
     """A malformed Crockford string is rejected."""
-    with pytest.raises(CrockfordUUIDError):
+    with pytest.raises(CrockfordUUIDError, match="invalid Crockford UUID string"):
         CrockfordUUID("invalid")
 
 
@@ -46,3 +119,18 @@ def test_generate_v7_unavailable(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.delattr(uuid, "uuid7", raising=False)
     with pytest.raises(NotImplementedError):
         CrockfordUUID.generate_v7()
+
+
+def test_decode_many_round_trip() -> None:
+    """Batch decoding matches constructing each identifier individually."""
+    originals = [CrockfordUUID.generate_v4() for _ in range(5)]
+    decoded = decode_many([str(cuuid) for cuuid in originals])
+    assert decoded == originals
+    assert all(type(cuuid) is CrockfordUUID for cuuid in decoded)
+
+
+def test_decode_many_invalid_item() -> None:
+    """A malformed item anywhere in the batch is rejected."""
+    valid = str(CrockfordUUID.generate_v4())
+    with pytest.raises(CrockfordUUIDError):
+        decode_many([valid, "invalid"])
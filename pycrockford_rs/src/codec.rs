@@ -0,0 +1,222 @@
+//! Fixed-width Crockford Base32 codec for 128-bit UUIDs.
+//!
+//! A UUID is always 16 bytes and always 26 symbols, so both directions work on
+//! the whole value held in registers rather than streaming bits through a
+//! general-purpose base32 engine. The loops have constant trip counts and are
+//! fully unrolled by the compiler.
+
+/// Number of symbols in an encoded UUID: 128 bits in 5-bit groups, rounded up.
+pub const ENCODED_LEN: usize = 26;
+
+/// Crockford's alphabet, indexed by 5-bit symbol value.
+const ALPHABET: [u8; 32] = *b"0123456789ABCDEFGHJKMNPQRSTVWXYZ";
+
+/// Set in a decoded symbol when the input byte is outside the alphabet; it
+/// lies above the five value bits so errors can be OR-ed across symbols.
+const INVALID: u32 = 0x100;
+
+/// Set in the error register when the final symbol carries padding bits.
+const PADDING: u32 = 0x200;
+
+/// All-ones when `lo <= c <= hi`, zero otherwise, without branching on `c`.
+///
+/// Both differences are negative only when `c` is inside the range, and they
+/// stay within nine bits, so the arithmetic shift smears the sign bit.
+#[inline(always)]
+const fn range_mask(c: i32, lo: u8, hi: u8) -> i32 {
+    ((lo as i32 - 1 - c) & (c - hi as i32 - 1)) >> 8
+}
+
+/// Decode one symbol to its 5-bit value, or a value with `INVALID` set.
+///
+/// Identifiers may be bearer tokens, so the value is derived arithmetically
+/// from the Crockford ranges rather than by indexing a table with the input,
+/// which would leak symbols through the data cache. Each range contributes
+/// through a mask; the ranges are disjoint so at most one mask is set.
+#[inline(always)]
+const fn decode_symbol(byte: u8) -> u32 {
+    // `From` is not usable in a `const fn`; every cast here widens losslessly.
+    let c = byte as i32;
+    // Folding bit 0x20 maps only ASCII letters onto `a..=z`, so every letter
+    // range below is case-insensitive while digits are checked unfolded.
+    let l = c | 0x20;
+    let digit = range_mask(c, b'0', b'9');
+    let a_to_h = range_mask(l, b'a', b'h');
+    let j_to_k = range_mask(l, b'j', b'k');
+    let m_to_n = range_mask(l, b'm', b'n');
+    let p_to_t = range_mask(l, b'p', b't');
+    let v_to_z = range_mask(l, b'v', b'z');
+    let one = range_mask(l, b'i', b'i') | range_mask(l, b'l', b'l');
+    let zero = range_mask(l, b'o', b'o');
+
+    let value = (digit & (c - b'0' as i32))
+        | (a_to_h & (l - b'a' as i32 + 10))
+        | (j_to_k & (l - b'j' as i32 + 18))
+        | (m_to_n & (l - b'm' as i32 + 20))
+        | (p_to_t & (l - b'p' as i32 + 22))
+        | (v_to_z & (l - b'v' as i32 + 27))
+        | (one & 1);
+    let valid = digit | a_to_h | j_to_k | m_to_n | p_to_t | v_to_z | one | zero;
+    // `value` is within 0..=31 and `INVALID` within 0x100, so the sign-free
+    // reinterpretation below is lossless.
+    (value | (!valid & INVALID as i32)) as u32
+}
+
+// Checked at compile time: the arithmetic decoder must invert `ALPHABET` in
+// both cases and honour the aliases, so the two cannot drift apart.
+const _: () = {
+    let mut index = 0;
+    while index < ALPHABET.len() {
+        assert!(decode_symbol(ALPHABET[index]) == index as u32);
+        assert!(decode_symbol(ALPHABET[index].to_ascii_lowercase()) == index as u32);
+        index += 1;
+    }
+    assert!(decode_symbol(b'I') == 1 && decode_symbol(b'i') == 1);
+    assert!(decode_symbol(b'L') == 1 && decode_symbol(b'l') == 1);
+    assert!(decode_symbol(b'O') == 0 && decode_symbol(b'o') == 0);
+    assert!(decode_symbol(b'U') & INVALID != 0 && decode_symbol(b'u') & INVALID != 0);
+};
+
+#[derive(Debug, PartialEq, Eq)]
+pub enum CrockfordError {
+    /// The input held the given number of symbols instead of 26.
+    InvalidLength(usize),
+    /// The symbol at the given index (ignoring hyphens) is not in the alphabet.
+    InvalidCharacter(usize),
+    /// The final symbol carries bits beyond the 128 that make up a UUID.
+    NonZeroPadding,
+}
+
+impl std::fmt::Display for CrockfordError {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        match self {
+            CrockfordError::InvalidLength(len) => {
+                write!(f, "expected {ENCODED_LEN} symbols, got {len}")
+            }
+            CrockfordError::InvalidCharacter(index) => {
+                write!(f, "invalid Crockford symbol at position {index}")
+            }
+            CrockfordError::NonZeroPadding => f.write_str("non-zero trailing bits"),
+        }
+    }
+}
+
+impl std::error::Error for CrockfordError {}
+
+/// The 26 ASCII symbols of an encoded UUID.
+pub struct EncodedUuid([u8; ENCODED_LEN]);
+
+impl EncodedUuid {
+    pub fn as_bytes(&self) -> &[u8; ENCODED_LEN] {
+        &self.0
+    }
+
+    pub fn as_str(&self) -> &str {
+        // SAFETY: the buffer is only ever filled from `ALPHABET`, which is ASCII.
+        unsafe { std::str::from_utf8_unchecked(&self.0) }
+    }
+}
+
+/// Encode 16 bytes into their 26-symbol Crockford form.
+///
+/// The value is read as one big-endian `u128` and shifted left by two so the
+/// 130-bit symbol stream ends on a symbol boundary with zero padding.
+#[inline(always)]
+pub fn encode_uuid(bytes: &[u8; 16]) -> EncodedUuid {
+    let value = u128::from_be_bytes(*bytes);
+    let mut out = [0u8; ENCODED_LEN];
+    for (index, slot) in out[..ENCODED_LEN - 1].iter_mut().enumerate() {
+        let shift = 123 - 5 * index;
+        *slot = ALPHABET[((value >> shift) & 0x1F) as usize];
+    }
+    out[ENCODED_LEN - 1] = ALPHABET[((value << 2) & 0x1F) as usize];
+    EncodedUuid(out)
+}
+
+pub fn encode_bytes_to_crockford(bytes: &[u8; 16]) -> String {
+    encode_uuid(bytes).as_str().to_owned()
+}
+
+/// Decode exactly 26 symbols, with no separators, into a 128-bit value.
+///
+/// Symbol errors and padding bits are OR-ed into a single error register so
+/// the work done is the same for every well-formed input, and validation costs
+/// one branch after the loop rather than one per symbol.
+#[inline(always)]
+fn decode_symbols(symbols: &[u8; ENCODED_LEN]) -> Result<u128, CrockfordError> {
+    let mut value = 0u128;
+    let mut errors = 0u32;
+    for &symbol in &symbols[..ENCODED_LEN - 1] {
+        let digit = decode_symbol(symbol);
+        errors |= digit;
+        value = (value << 5) | u128::from(digit & 0x1F);
+    }
+    let last = decode_symbol(symbols[ENCODED_LEN - 1]);
+    // Fold both padding bits into bit 0 before moving it onto `PADDING`.
+    errors |= last | (((last | (last >> 1)) & 1) << 9);
+    if errors & (INVALID | PADDING) != 0 {
+        return Err(classify_error(symbols));
+    }
+    Ok((value << 3) | u128::from((last & 0x1F) >> 2))
+}
+
+/// Work out why `decode_symbols` rejected its input.
+///
+/// Only reached for malformed input, so it may branch freely.
+#[cold]
+fn classify_error(symbols: &[u8; ENCODED_LEN]) -> CrockfordError {
+    match symbols
+        .iter()
+        .position(|&symbol| decode_symbol(symbol) & INVALID != 0)
+    {
+        Some(index) => CrockfordError::InvalidCharacter(index),
+        None => CrockfordError::NonZeroPadding,
+    }
+}
+
+/// Copy the non-hyphen bytes of `input` into a fixed symbol buffer.
+fn strip_hyphens(input: &[u8]) -> Result<[u8; ENCODED_LEN], CrockfordError> {
+    let mut symbols = [0u8; ENCODED_LEN];
+    let mut count = 0;
+    for &byte in input.iter().filter(|&&byte| byte != b'-') {
+        if let Some(slot) = symbols.get_mut(count) {
+            *slot = byte;
+        }
+        count += 1;
+    }
+    if count != ENCODED_LEN {
+        return Err(CrockfordError::InvalidLength(count));
+    }
+    Ok(symbols)
+}
+
+/// Decode a Crockford string to the UUID's value as a big-endian integer.
+pub fn decode_crockford_to_u128(s: &str) -> Result<u128, CrockfordError> {
+    let input = s.as_bytes();
+    // Canonical input is exactly 26 symbols with no separators; only pay for
+    // hyphen stripping when that fails.
+    if let Ok(symbols) = <&[u8; ENCODED_LEN]>::try_from(input) {
+        let decoded = decode_symbols(symbols);
+        if decoded.is_ok() || !input.contains(&b'-') {
+            return decoded;
+        }
+    }
+    decode_symbols(&strip_hyphens(input)?)
+}
+
+pub fn decode_crockford_to_bytes(s: &str) -> Result<[u8; 16], CrockfordError> {
+    decode_crockford_to_u128(s).map(u128::to_be_bytes)
+}
+
+/// Decode `items` into `out`, 16 bytes per item in input order.
+///
+/// `out` must hold exactly `16 * items.len()` bytes. On failure the error
+/// carries the index of the first malformed item.
+pub fn decode_many_into(items: &[&str], out: &mut [u8]) -> Result<(), (usize, CrockfordError)> {
+    let (chunks, _) = out.as_chunks_mut::<16>();
+    debug_assert_eq!(chunks.len(), items.len());
+    for (index, (item, chunk)) in items.iter().zip(chunks).enumerate() {
+        *chunk = decode_crockford_to_bytes(item).map_err(|e| (index, e))?;
+    }
+    Ok(())
+}
@@ -1,46 +1,21 @@
 //! Rust bindings exposing Crockford Base32 UUID helpers to Python.
 
-use data_encoding::{Encoding, Specification};
 use pyo3::basic::CompareOp;
 use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
 use pyo3::sync::PyOnceLock;
-use pyo3::types::{PyAny, PyBytes, PyDict, PyModule, PyString, PyType};
+use pyo3::types::{PyAny, PyBytes, PyDict, PyList, PyModule, PyString, PyType};
 use pyo3::IntoPyObjectExt;
 use std::collections::hash_map::DefaultHasher;
 use std::hash::{Hash, Hasher};
-use std::sync::LazyLock;
 use uuid::Uuid;
 
-#[derive(Debug)]
-pub enum CrockfordError {
-    InvalidLength(usize),
-    DecodeError(data_encoding::DecodeError),
-}
-
-impl std::fmt::Display for CrockfordError {
-    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
-        match self {
-            CrockfordError::InvalidLength(len) => write!(f, "expected 16 bytes, got {len}"),
-            CrockfordError::DecodeError(e) => write!(f, "{e}"),
-        }
-    }
-}
+mod codec;
 
-impl std::error::Error for CrockfordError {}
-
-static CROCKFORD: LazyLock<Encoding> = LazyLock::new(|| {
-    let mut spec = Specification::new();
-    spec.symbols.push_str("0123456789ABCDEFGHJKMNPQRSTVWXYZ");
-    // Accept lowercase input for all allowed characters.
-    spec.translate.from = "abcdefghjkmnpqrstvwxyz".into();
-    spec.translate.to = "ABCDEFGHJKMNPQRSTVWXYZ".into();
-    // Handle visually similar characters per Crockford spec.
-    spec.translate.from.push_str("ilILoO");
-    spec.translate.to.push_str("111100");
-    spec.ignore.push('-');
-    spec.encoding().unwrap()
-});
+pub use codec::{
+    decode_crockford_to_bytes, decode_crockford_to_u128, decode_many_into,
+    encode_bytes_to_crockford, encode_uuid, CrockfordError, EncodedUuid, ENCODED_LEN,
+};
 
 // Cache the 'uuid' module to avoid repeated imports at runtime.
 fn uuid_module(py: Python<'_>) -> PyResult<Bound<'_, PyModule>> {
@@ -50,28 +25,18 @@ fn uuid_module(py: Python<'_>) -> PyResult<Bound<'_, PyModule>> {
     Ok(module.bind(py).clone())
 }
 
-pub fn encode_bytes_to_crockford(bytes: &[u8; 16]) -> String {
-    CROCKFORD.encode(bytes)
-}
-
-pub fn decode_crockford_to_bytes(s: &str) -> Result<[u8; 16], CrockfordError> {
-    let decoded = CROCKFORD
-        .decode(s.as_bytes())
-        .map_err(CrockfordError::DecodeError)?;
-    if decoded.len() != 16 {
-        return Err(CrockfordError::InvalidLength(decoded.len()));
-    }
-    let mut out = [0u8; 16];
-    out.copy_from_slice(&decoded);
-    Ok(out)
-}
-
+/// Encode 16 bytes as a Crockford string.
+///
+/// The symbols go from a stack buffer straight to CPython, whose UTF-8
+/// decoder takes its ASCII fast path and yields a compact ASCII string.
+/// Writing into `PyUnicode_New` storage directly would skip that scan, but
+/// it is outside the limited API this abi3 module builds against.
 #[pyfunction]
-fn encode_crockford(b: &[u8]) -> PyResult<String> {
+fn encode_crockford<'py>(py: Python<'py>, b: &[u8]) -> PyResult<Bound<'py, PyString>> {
     let arr: &[u8; 16] = b
         .try_into()
         .map_err(|_| PyValueError::new_err(format!("expected 16 bytes, got {}", b.len())))?;
-    Ok(encode_bytes_to_crockford(arr))
+    Ok(PyString::new(py, encode_uuid(arr).as_str()))
 }
 
 #[pyfunction]
@@ -80,6 +45,66 @@ fn decode_crockford(py: Python<'_>, s: &str) -> PyResult<Py<PyBytes>> {
     Ok(PyBytes::new(py, &bytes).unbind())
 }
 
+/// Decode a Crockford string to the UUID's 128-bit integer value, returning
+/// `None` if it is malformed.
+///
+/// `uuid.UUID` stores its value as an `int`, so returning one directly skips
+/// the intermediate `bytes` object. Constructing a `PyErr` is comparatively
+/// costly, so callers that only need a valid/invalid verdict avoid it.
+#[pyfunction]
+fn try_decode_crockford_int(s: &Bound<'_, PyString>) -> Option<u128> {
+    decode_crockford_to_u128(s.to_str().ok()?).ok()
+}
+
+/// Encode a buffer of concatenated 16-byte UUIDs, one string per UUID.
+///
+/// Batching keeps the Python/Rust boundary crossing to one call per buffer
+/// rather than one per identifier.
+#[pyfunction]
+fn encode_crockford_many(py: Python<'_>, buf: &[u8]) -> PyResult<Py<PyList>> {
+    let (chunks, remainder) = buf.as_chunks::<16>();
+    if !remainder.is_empty() {
+        return Err(PyValueError::new_err(format!(
+            "expected a multiple of 16 bytes, got {}",
+            buf.len()
+        )));
+    }
+    let encoded = chunks
+        .iter()
+        .map(|chunk| PyString::new(py, encode_uuid(chunk).as_str()));
+    PyList::new(py, encoded).map(Bound::unbind)
+}
+
+/// Decode an iterable of Crockford strings into one flat buffer.
+///
+/// The result holds the decoded UUIDs back to back, 16 bytes each, in input
+/// order; callers slice it rather than receiving one `bytes` per item.
+///
+/// The GIL is released while decoding, so threads decoding separate batches
+/// run in parallel. Single-item functions keep it held, as releasing and
+/// reacquiring would cost more than the decode itself.
+#[pyfunction]
+fn decode_crockford_many(py: Python<'_>, items: &Bound<'_, PyAny>) -> PyResult<Py<PyBytes>> {
+    // Borrowing the UTF-8 views of the strings needs the GIL; decoding them
+    // does not, and the strings stay alive until this function returns.
+    let strings = items
+        .try_iter()?
+        .map(|item| Ok(item?.cast_into::<PyString>()?))
+        .collect::<PyResult<Vec<_>>>()?;
+    let symbols = strings
+        .iter()
+        .map(|s| s.to_str())
+        .collect::<PyResult<Vec<&str>>>()?;
+    // Decode straight into the result's buffer rather than a staging `Vec`.
+    // The object is not reachable from Python until returned, so writing to
+    // it with the GIL released is sound.
+    let out = PyBytes::new_with(py, symbols.len() * 16, |out| {
+        py.detach(|| decode_many_into(&symbols, out))
+            .map_err(|(index, e)| PyValueError::new_err(format!("item {index}: {e}")))
+    })?;
+    Ok(out.unbind())
+}
+
 #[pyclass]
 struct CrockfordUUID {
     bytes: [u8; 16],
@@ -110,9 +135,11 @@ impl CrockfordUUID {
                 "expected Crockford string, 16 bytes, or uuid.UUID",
             ));
         }
-        let bytes_vec: Vec<u8> = value.getattr("bytes")?.extract()?;
-        let arr: [u8; 16] = bytes_vec.as_slice().try_into().map_err(|_| {
-            PyValueError::new_err(format!("expected 16 bytes, got {}", bytes_vec.len()))
+        // Borrow the `bytes` buffer in place instead of copying it into a `Vec`.
+        let bytes_obj = value.getattr("bytes")?;
+        let slice = bytes_obj.cast::<PyBytes>()?.as_bytes();
+        let arr: [u8; 16] = slice.try_into().map_err(|_| {
+            PyValueError::new_err(format!("expected 16 bytes, got {}", slice.len()))
         })?;
         Ok(Self { bytes: arr })
     }
@@ -149,8 +176,8 @@ impl CrockfordUUID {
         PyBytes::new(py, &self.bytes).unbind()
     }
 
-    fn __str__(&self) -> String {
-        encode_bytes_to_crockford(&self.bytes)
+    fn __str__<'py>(&self, py: Python<'py>) -> Bound<'py, PyString> {
+        PyString::new(py, encode_uuid(&self.bytes).as_str())
     }
 
     fn __repr__(&self) -> String {
@@ -204,6 +231,9 @@ impl CrockfordUUID {
 fn _pycrockford_rs_bindings(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(decode_crockford, m)?)?;
     m.add_function(wrap_pyfunction!(encode_crockford, m)?)?;
+    m.add_function(wrap_pyfunction!(try_decode_crockford_int, m)?)?;
+    m.add_function(wrap_pyfunction!(decode_crockford_many, m)?)?;
+    m.add_function(wrap_pyfunction!(encode_crockford_many, m)?)?;
     m.add_class::<CrockfordUUID>()?;
     Ok(())
 }
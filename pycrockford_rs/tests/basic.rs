@@ -1,7 +1,10 @@
 use _pycrockford_rs_bindings::{
-    decode_crockford_to_bytes, encode_bytes_to_crockford, CrockfordError,
+    decode_crockford_to_bytes, decode_many_into, encode_bytes_to_crockford, CrockfordError,
 };
 
+const SEQUENTIAL: [u8; 16] = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15];
+const SEQUENTIAL_ENCODED: &str = "000G40R40M30E209185GR38E1W";
+
 #[test]
 fn round_trip() {
     let bytes = [1u8; 16];
@@ -10,16 +13,38 @@ fn round_trip() {
     assert_eq!(bytes, decoded);
 }
 
+#[test]
+fn encode_matches_reference_vectors() {
+    assert_eq!(encode_bytes_to_crockford(&SEQUENTIAL), SEQUENTIAL_ENCODED);
+    assert_eq!(
+        encode_bytes_to_crockford(&[0xFF; 16]),
+        "ZZZZZZZZZZZZZZZZZZZZZZZZZW"
+    );
+}
+
 #[test]
 fn decode_invalid_length() {
     let err = decode_crockford_to_bytes("ABC").unwrap_err();
-    assert!(matches!(err, CrockfordError::DecodeError(_)));
+    assert_eq!(err, CrockfordError::InvalidLength(3));
 }
 
 #[test]
 fn decode_invalid_character() {
     let err = decode_crockford_to_bytes("********").unwrap_err();
-    assert!(matches!(err, CrockfordError::DecodeError(_)));
+    assert_eq!(err, CrockfordError::InvalidLength(8));
+
+    let err = decode_crockford_to_bytes("000G40R40M30E2*9185GR38E1W").unwrap_err();
+    assert_eq!(err, CrockfordError::InvalidCharacter(14));
+}
+
+#[test]
+fn decode_rejects_non_zero_padding() {
+    // `X`, `Y` and `Z` set bit 0, bit 1 and both padding bits respectively.
+    for last in ['X', 'Y', 'Z'] {
+        let input = format!("000G40R40M30E209185GR38E1{last}");
+        let err = decode_crockford_to_bytes(&input).unwrap_err();
+        assert_eq!(err, CrockfordError::NonZeroPadding, "final symbol {last}");
+    }
 }
 
 #[test]
@@ -29,3 +54,54 @@ fn decode_is_case_insensitive() {
     let decoded = decode_crockford_to_bytes(&encoded.to_lowercase()).unwrap();
     assert_eq!(decoded, bytes);
 }
+
+#[test]
+fn decode_accepts_aliases() {
+    let decoded = decode_crockford_to_bytes("oOoG4oR4oM3oE2o9i85GR38E1W").unwrap();
+    assert_eq!(decoded, SEQUENTIAL);
+    let decoded = decode_crockford_to_bytes("000G40R40M30E209L85GR38E1W").unwrap();
+    assert_eq!(decoded, SEQUENTIAL);
+}
+
+#[test]
+fn decode_ignores_hyphens() {
+    let decoded = decode_crockford_to_bytes("000G40R4-0M30E209-185GR38E1W").unwrap();
+    assert_eq!(decoded, SEQUENTIAL);
+
+    let err = decode_crockford_to_bytes("000G40R4-0M30E209185GR38E1").unwrap_err();
+    assert_eq!(err, CrockfordError::InvalidLength(25));
+}
+
+#[test]
+fn decode_symbol_ranges() {
+    let alphabet = "0123456789ABCDEFGHJKMNPQRSTVWXYZ";
+    for (value, symbol) in alphabet.chars().enumerate() {
+        for symbol in [symbol, symbol.to_ascii_lowercase()] {
+            let input = format!("{symbol}{}", "0".repeat(25));
+            let decoded = decode_crockford_to_bytes(&input).unwrap();
+            assert_eq!(usize::from(decoded[0] >> 3), value, "symbol {symbol}");
+        }
+    }
+    for symbol in ['U', 'u', '/', ':', '@', '[', '`', '{'] {
+        let input = format!("{symbol}{}", "0".repeat(25));
+        let err = decode_crockford_to_bytes(&input).unwrap_err();
+        assert_eq!(err, CrockfordError::InvalidCharacter(0), "symbol {symbol}");
+    }
+}
+
+#[test]
+fn decode_many_fills_buffer_in_order() {
+    let zero = encode_bytes_to_crockford(&[0u8; 16]);
+    let mut out = [0xAAu8; 32];
+    decode_many_into(&[SEQUENTIAL_ENCODED, &zero], &mut out).unwrap();
+    assert_eq!(out[..16], SEQUENTIAL);
+    assert_eq!(out[16..], [0u8; 16]);
+}
+
+#[test]
+fn decode_many_reports_failing_index() {
+    let mut out = [0u8; 48];
+    let err =
+        decode_many_into(&[SEQUENTIAL_ENCODED, SEQUENTIAL_ENCODED, "ABC"], &mut out).unwrap_err();
+    assert_eq!(err, (2, CrockfordError::InvalidLength(3)));
+}
@@ -4,6 +4,9 @@ import uuid
 from _pycrockford_rs_bindings import (
     encode_crockford,
     decode_crockford,
+    decode_crockford_many,
+    encode_crockford_many,
+    try_decode_crockford_int,
     CrockfordUUID,
 )  # type: ignore[attr-defined]
 
@@ -15,6 +18,12 @@ def test_round_trip() -> None:
     assert decoded == raw
 
 
+def test_try_decode_int() -> None:
+    raw = bytes(range(16))
+    assert try_decode_crockford_int(encode_crockford(raw)) == uuid.UUID(bytes=raw).int
+    assert try_decode_crockford_int("invalid") is None
+
+
 def test_crockforduuid_construction_and_equality() -> None:
     raw = bytes(range(16))
     uuid_obj = uuid.UUID(bytes=raw)
@@ -30,6 +39,14 @@ def test_crockforduuid_construction_and_equality() -> None:
     assert isinstance(by_uuid.uuid, uuid.UUID)
 
 
+def test_encoded_output_is_ascii() -> None:
+    raw = bytes(range(16))
+    encoded = encode_crockford(raw)
+    assert len(encoded) == 26
+    assert encoded.isascii()
+    assert str(CrockfordUUID(raw)) == encoded
+
+
 def test_case_insensitive_decoding() -> None:
     raw = bytes(range(16))
     encoded = encode_crockford(raw).lower()
@@ -40,3 +57,10 @@ def test_dunder_bytes() -> None:
     raw = bytes(range(16))
     cuuid = CrockfordUUID(raw)
     assert bytes(cuuid) == raw
+
+
+def test_many_round_trip() -> None:
+    raws = [bytes(range(start, start + 16)) for start in (0, 16, 32)]
+    encoded = encode_crockford_many(b"".join(raws))
+    assert encoded == [encode_crockford(raw) for raw in raws]
+    assert decode_crockford_many(encoded) == b"".join(raws)